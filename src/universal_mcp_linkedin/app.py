@@ -1,30 +1,201 @@
-from universal_mcp.applications import APIApplication
-from universal_mcp.integrations import Integration
+import asyncio
+import re
+from collections.abc import Awaitable, Callable, Mapping
+from time import monotonic
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import quote
 
+import httpx
+import orjson
+from universal_mcp.applications import APIApplication
+from universal_mcp.integrations import (
+    AgentRIntegration,
+    Integration,
+    OAuthIntegration,
+)
+
+_URN_RE = re.compile(r"urn:li:(?:ugcPost|share):\d+")
+
+# Shared by every post that uses the default distribution; never mutated.
+# The tuple values serialize natively with orjson.
+_DEFAULT_DISTRIBUTION = {
+    "feedDistribution": "MAIN_FEED",
+    "targetEntities": (),
+    "thirdPartyDistributionChannels": (),
+}
+
+
+def _validate_post_urn(post_urn: str) -> None:
+    """
+    Rejects malformed post URNs before they cost an API call.
+    """
+    if not _URN_RE.fullmatch(post_urn):
+        raise ValueError(f"Invalid post URN: {post_urn}")
+
+
+def _encode_urn(urn: str) -> str:
+    """
+    Percent-encodes a URN for use as a URL path segment.
+    Plain LinkedIn URNs only need their colons escaped.
+    """
+    if urn.startswith("urn:li:") and urn.isascii() and urn.replace(":", "").isalnum():
+        return urn.replace(":", "%3A")
+    return quote(urn, safe="")
+
+
 class LinkedinApp(APIApplication):
     """
     Base class for Universal MCP Applications.
     """
+    _STATIC_HEADERS = MappingProxyType({
+        "X-Restli-Protocol-Version": "2.0.0",
+        "Content-Type": "application/json",
+        "LinkedIn-Version": "202507",
+    })
+    _POSTS_PATH = "/rest/posts"
+    _USERINFO_PATH = "/v2/userinfo"
+    _FEED_URL_PREFIX = "https://www.linkedin.com/feed/update/"
+    _BATCH_DELETE_SIZE = 100
+    _RESTLI_ID_HEADER = "x-restli-id"
+    _USERINFO_TTL = 300.0
+    _RATE_LIMIT_RETRIES = 3
+    _RATE_LIMIT_BACKOFF = 1.0
+    _MAX_CONCURRENT_REQUESTS = 32
+
     def __init__(self, integration: Integration | None = None, **kwargs) -> None:
         super().__init__(name="linkedin", integration=integration, **kwargs)
         self.base_url="https://api.linkedin.com"
+        self._async_client: httpx.AsyncClient | None = None
+        self._cached_headers: Mapping[str, str] | None = None
+        self._userinfo_cache: tuple[float, dict[str, Any]] | None = None
+        self._userinfo_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_REQUESTS)
+        self._tools = (
+            self.create_post,
+            self.create_posts,
+            self.get_your_info,
+            self.delete_post,
+            self.batch_delete_posts,
+            self.update_post,
+        )
+
+    def _session(self) -> httpx.AsyncClient:
+        """
+        Returns the shared async client, creating it on first use.
+        Idle connections are kept alive (over HTTP/2 where available) so
+        later calls skip the TCP and TLS handshakes. HTTP/2 multiplexes
+        requests over one connection, so concurrency is bounded by the
+        semaphore in _arequest rather than by the connection limit.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=30.0,
+                http2=True,
+            )
+        return self._async_client
+
+    async def _arequest(
+        self,
+        method: str,
+        path: str,
+        data: Mapping[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        Sends a request with the cached auth headers, at most
+        _MAX_CONCURRENT_REQUESTS at a time. On a 401 the credentials are
+        refreshed and the request is retried once, reusing the already
+        serialized body. LinkedIn rejects a 401 before
+        acting on it, so this is safe for POST as well.
+        """
+        content = None
+        if data is not None:
+            content = orjson.dumps(data)
+        for _ in range(2):
+            request_headers = await self._aget_headers()
+            if headers:
+                request_headers = {**request_headers, **headers}
+            async with self._request_semaphore:
+                response = await self._session().request(
+                    method,
+                    path,
+                    content=content,
+                    params=params,
+                    headers=request_headers,
+                )
+            if response.status_code != httpx.codes.UNAUTHORIZED:
+                break
+            self._invalidate_headers()
+            await asyncio.to_thread(self._refresh_credentials)
+        return response
 
-    def _get_headers(self):
+    def _handle_response(self, response: httpx.Response) -> Any:
+        """
+        Decodes successful JSON bodies with orjson. Errors, empty bodies
+        and non-JSON content keep the base class handling.
+        """
+        if response.is_success and response.content:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+        return super()._handle_response(response)
+
+    def _get_headers(self) -> Mapping[str, str]:
+        if self._cached_headers is not None:
+            return self._cached_headers
         if not self.integration:
             raise ValueError("Integration not found")
         credentials = self.integration.get_credentials()
         if "headers" in credentials:
-            return credentials["headers"]
-        return {
-            "Authorization": f"Bearer {credentials['access_token']}",
-            "X-Restli-Protocol-Version": "2.0.0",
-            "Content-Type": "application/json",
-            "LinkedIn-Version": "202507"
-        }
+            # Request bodies are sent pre-serialized, so httpx no longer sets this.
+            headers = {"Content-Type": "application/json", **credentials["headers"]}
+        else:
+            headers = {
+                **self._STATIC_HEADERS,
+                "Authorization": f"Bearer {credentials['access_token']}",
+            }
+        self._cached_headers = MappingProxyType(dict(headers))
+        return self._cached_headers
+
+    async def _aget_headers(self) -> Mapping[str, str]:
+        """
+        Async form of _get_headers. On a cache miss the credentials are
+        fetched in a worker thread, since integrations such as
+        AgentRIntegration read them with a blocking HTTP call.
+        """
+        if self._cached_headers is not None:
+            return self._cached_headers
+        return await asyncio.to_thread(self._get_headers)
+
+    def _refresh_credentials(self) -> None:
+        """
+        Makes the next get_credentials call return a fresh token. OAuth
+        integrations refresh the token directly, and AgentR integrations
+        drop the credentials they cached on first fetch.
+        """
+        if isinstance(self.integration, OAuthIntegration):
+            self.integration.refresh_token()
+        elif isinstance(self.integration, AgentRIntegration):
+            self.integration._credentials = None
+
+    def _invalidate_headers(self) -> None:
+        """
+        Drops the cached headers so the next call re-reads the credentials.
+        The cached profile belongs to the old credentials and goes too.
+        """
+        self._cached_headers = None
+        self._userinfo_cache = None
 
-    def create_post(
+    async def create_post(
         self,
         commentary: str,
         author: str,
@@ -50,7 +221,7 @@ class LinkedinApp(APIApplication):
             is_reshare_disabled (bool): Whether resharing is disabled by the author. Set to True to prevent other users from resharing this post, or False to allow resharing. Defaults to False.
 
         Returns:
-            dict[str, str]: Dictionary containing the post ID with key "post_id". Example: {"post_id": "urn:li:share:6844785523593134080"}
+            dict[str, str]: Dictionary containing the URN and feed URL of the created post. Example: {"post_urn": "urn:li:share:6844785523593134080", "post_url": "https://www.linkedin.com/feed/update/urn:li:share:6844785523593134080"}
 
         Raises:
             ValueError: If required parameters (commentary, author) are missing or if x-restli-id header is not found
@@ -64,11 +235,7 @@ class LinkedinApp(APIApplication):
         """
         # Set default distribution if not provided
         if distribution is None:
-            distribution = {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": []
-            }
+            distribution = _DEFAULT_DISTRIBUTION
         
         request_body_data = {
             "author": author,
@@ -79,24 +246,106 @@ class LinkedinApp(APIApplication):
             "isReshareDisabledByAuthor": is_reshare_disabled,
         }
         
-        url = f"{self.base_url}/rest/posts"
-        query_params = {}
-        
-        response = self._post(
-            url,
+        return await self._raw_create(request_body_data)
+
+    async def create_posts(
+        self,
+        items: list[dict[str, Any]],
+        concurrency: int = 10,
+    ) -> dict[str, Any]:
+        """
+        Create multiple posts on LinkedIn concurrently.
+
+        Args:
+            items (list[dict[str, Any]]): The posts to create. Each item holds the keyword arguments of create_post, at least "commentary" and "author". Example: [{"commentary": "Hello", "author": "urn:li:person:wGgGaX_xbB"}]
+            concurrency (int): Maximum number of posts created at the same time. Must be at least 1. Defaults to 10.
+
+        Returns:
+            dict[str, Any]: Dictionary with the created posts and the failures, both keyed by the index of the item in items. Example: {"created": {"0": {"post_urn": "urn:li:share:6844785523593134080", "post_url": "https://www.linkedin.com/feed/update/urn:li:share:6844785523593134080"}}, "failed": {"1": "Client error '403 Forbidden' ..."}}
+
+        Raises:
+            ValueError: If concurrency is less than 1 or if integration is not found
+
+        Notes:
+            A failed item does not stop the others. Rate limited requests (HTTP 429) are retried with exponential backoff. Each post counts against the limit of 150 requests per day per member.
+
+        Tags:
+            posts, batch
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create_one(kwargs: dict[str, Any]) -> dict[str, str]:
+            async with semaphore:
+                for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+                    try:
+                        return await self.create_post(**kwargs)
+                    except httpx.HTTPStatusError as e:
+                        if (
+                            e.response.status_code != httpx.codes.TOO_MANY_REQUESTS
+                            or attempt == self._RATE_LIMIT_RETRIES
+                        ):
+                            raise
+                        await asyncio.sleep(self._RATE_LIMIT_BACKOFF * 2 ** attempt)
+
+        results = await asyncio.gather(
+            *(create_one(item) for item in items), return_exceptions=True
+        )
+
+        created = {}
+        failed = {}
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                failed[str(index)] = str(result)
+            else:
+                created[str(index)] = result
+        return {"created": created, "failed": failed}
+
+    async def _raw_create(self, request_body_data: dict[str, Any]) -> dict[str, str]:
+        response = await self._arequest(
+            "POST",
+            self._POSTS_PATH,
             data=request_body_data,
-            params=query_params,
         )
-        
+
         self._handle_response(response)
-        
-        post_id = response.headers.get("x-restli-id")
+
+        post_id = response.headers.get(self._RESTLI_ID_HEADER)
         if not post_id:
-            raise ValueError("x-restli-id header not found in response")
-        
-        return {"post_urn": post_id, "post_url": f"https://www.linkedin.com/feed/update/{post_id}"}
+            raise ValueError(f"{self._RESTLI_ID_HEADER} header not found in response")
+
+        return {"post_urn": post_id, "post_url": self._FEED_URL_PREFIX + post_id}
+
+    def bind_poster(
+        self,
+        author: str,
+        visibility: str = "PUBLIC",
+        distribution: dict[str, Any] | None = None,
+        lifecycle_state: str = "PUBLISHED",
+        is_reshare_disabled: bool = False,
+    ) -> Callable[[str], Awaitable[dict[str, str]]]:
+        """
+        Returns a coroutine function that creates posts with fixed settings.
+        The request body is built once here, so each call only fills in
+        the commentary. Arguments mirror those of create_post.
+        """
+        if distribution is None:
+            distribution = _DEFAULT_DISTRIBUTION
+        template = {
+            "author": author,
+            "visibility": visibility,
+            "distribution": distribution,
+            "lifecycleState": lifecycle_state,
+            "isReshareDisabledByAuthor": is_reshare_disabled,
+        }
+
+        async def post(commentary: str) -> dict[str, str]:
+            return await self._raw_create({**template, "commentary": commentary})
 
-    def get_your_info(self) -> dict[str, Any]:
+        return post
+
+    async def get_your_info(self) -> dict[str, Any]:
         """
         Get your LinkedIn profile information.
 
@@ -107,20 +356,32 @@ class LinkedinApp(APIApplication):
             ValueError: If integration is not found
             HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body
 
+        Notes:
+            The profile is cached for 5 minutes, and until the credentials change. Repeated calls return the same cached dictionary, so treat it as read-only.
+
         Tags:
             profile, info
         """
-        url = f"{self.base_url}/v2/userinfo"
-        query_params = {}
-        
-        response = self._get(
-            url,
-            params=query_params,
-        )
-        
-        return self._handle_response(response)
+        cached = self._userinfo_cache
+        if cached is not None and monotonic() < cached[0]:
+            return cached[1]
+
+        async with self._userinfo_lock:
+            # Another caller may have filled the cache while we waited.
+            cached = self._userinfo_cache
+            if cached is not None and monotonic() < cached[0]:
+                return cached[1]
+
+            response = await self._arequest(
+                "GET",
+                self._USERINFO_PATH,
+            )
+
+            payload = self._handle_response(response)
+            self._userinfo_cache = (monotonic() + self._USERINFO_TTL, payload)
+            return payload
 
-    def delete_post(self, post_urn: str) -> dict[str, str]:
+    async def delete_post(self, post_urn: str) -> dict[str, str]:
         """
         Delete a post on LinkedIn.
 
@@ -131,19 +392,19 @@ class LinkedinApp(APIApplication):
             dict[str, str]: Dictionary containing the deletion status. Example: {"status": "deleted", "post_urn": "urn:li:share:6844785523593134080"}
 
         Raises:
-            ValueError: If required parameter (post_urn) is missing or if integration is not found
+            ValueError: If post_urn is not a valid ugcPost or share URN or if integration is not found
             HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body
 
         
         Tags:
             posts, important
         """
-        url = f"{self.base_url}/rest/posts/{quote(post_urn, safe='')}"
-        query_params = {}
+        _validate_post_urn(post_urn)
+        url = self._POSTS_PATH + "/" + _encode_urn(post_urn)
         
-        response = self._delete(
+        response = await self._arequest(
+            "DELETE",
             url,
-            params=query_params,
         )
         
         if response.status_code == 204:
@@ -151,7 +412,66 @@ class LinkedinApp(APIApplication):
         else:
             return self._handle_response(response)
 
-    def update_post(
+    async def batch_delete_posts(self, post_urns: list[str]) -> dict[str, Any]:
+        """
+        Delete multiple posts on LinkedIn using batch requests.
+
+        Args:
+            post_urns (list[str]): The URNs of the posts to delete. Each can be either a ugcPostUrn (urn:li:ugcPost:{id}) or shareUrn (urn:li:share:{id}). Up to 100 URNs are sent per request; larger lists are split into several requests issued concurrently.
+
+        Returns:
+            dict[str, Any]: Dictionary with the deleted URNs and the per-URN errors for those that could not be deleted, including URNs the batch response does not mention. Example: {"deleted": ["urn:li:share:6844785523593134080"], "failed": {"urn:li:share:6844785523593134081": {"status": 404, "message": "Not Found"}}}
+
+        Raises:
+            ValueError: If any of post_urns is not a valid ugcPost or share URN or if integration is not found
+            HTTPStatusError: Raised when a batch request fails as a whole with detailed error information including status code and response body
+
+        Notes:
+            Uses the Rest.li BATCH_DELETE method, so each batch costs a single API call against the rate limits.
+
+        Tags:
+            posts, delete, batch
+        """
+        for urn in post_urns:
+            _validate_post_urn(urn)
+        chunks = [
+            post_urns[i:i + self._BATCH_DELETE_SIZE]
+            for i in range(0, len(post_urns), self._BATCH_DELETE_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(self._batch_delete(chunk) for chunk in chunks)
+        )
+
+        deleted = []
+        failed = {}
+        for chunk, body in zip(chunks, responses):
+            results = body.get("results", {})
+            errors = body.get("errors", {})
+            for urn in chunk:
+                result = results.get(urn)
+                if urn in errors:
+                    failed[urn] = errors[urn]
+                elif result is None:
+                    failed[urn] = {"message": "URN missing from batch response"}
+                elif result.get("status", 204) < httpx.codes.BAD_REQUEST:
+                    deleted.append(urn)
+                else:
+                    failed[urn] = result
+        return {"deleted": deleted, "failed": failed}
+
+    async def _batch_delete(self, post_urns: list[str]) -> dict[str, Any]:
+        ids = ",".join(_encode_urn(urn) for urn in post_urns)
+        url = f"{self._POSTS_PATH}?ids=List({ids})"
+
+        response = await self._arequest(
+            "DELETE",
+            url,
+            headers={"X-RestLi-Method": "BATCH_DELETE"},
+        )
+
+        return self._handle_response(response)
+
+    async def update_post(
         self,
         post_urn: str,
         commentary: str | None = None,
@@ -177,7 +497,7 @@ class LinkedinApp(APIApplication):
             dict[str, str]: Dictionary containing the update status. Example: {"status": "updated", "post_urn": "urn:li:share:6844785523593134080"}
 
         Raises:
-            ValueError: If required parameter (post_urn) is missing or if integration is not found
+            ValueError: If post_urn is not a valid ugcPost or share URN or if integration is not found
             HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body
 
      
@@ -186,36 +506,32 @@ class LinkedinApp(APIApplication):
         Tags:
             posts, update, important
         """
-        url = f"{self.base_url}/rest/posts/{quote(post_urn, safe='')}"
-        query_params = {}
+        _validate_post_urn(post_urn)
+        url = self._POSTS_PATH + "/" + _encode_urn(post_urn)
         
         # Build the patch data
-        patch_data = {"$set": {}}
-        ad_context_data = {}
-        
-        if commentary is not None:
-            patch_data["$set"]["commentary"] = commentary
-        if content_call_to_action_label is not None:
-            patch_data["$set"]["contentCallToActionLabel"] = content_call_to_action_label
-        if content_landing_page is not None:
-            patch_data["$set"]["contentLandingPage"] = content_landing_page
-        if lifecycle_state is not None:
-            patch_data["$set"]["lifecycleState"] = lifecycle_state
-        
-        if ad_context_name is not None or ad_context_status is not None:
-            ad_context_data["$set"] = {}
-            if ad_context_name is not None:
-                ad_context_data["$set"]["dscName"] = ad_context_name
-            if ad_context_status is not None:
-                ad_context_data["$set"]["dscStatus"] = ad_context_status
-            patch_data["adContext"] = ad_context_data
+        fields = (
+            ("commentary", commentary),
+            ("contentCallToActionLabel", content_call_to_action_label),
+            ("contentLandingPage", content_landing_page),
+            ("lifecycleState", lifecycle_state),
+        )
+        patch_data = {"$set": {k: v for k, v in fields if v is not None}}
+
+        ad_context_fields = (
+            ("dscName", ad_context_name),
+            ("dscStatus", ad_context_status),
+        )
+        ad_context_set = {k: v for k, v in ad_context_fields if v is not None}
+        if ad_context_set:
+            patch_data["adContext"] = {"$set": ad_context_set}
         
         request_body_data = {"patch": patch_data}
         
-        response = self._post(
+        response = await self._arequest(
+            "POST",
             url,
             data=request_body_data,
-            params=query_params,
         )
         
         if response.status_code == 204:
@@ -227,4 +543,4 @@ class LinkedinApp(APIApplication):
         """
         Lists the available tools (methods) for this application.
         """
-        return [self.create_post, self.get_your_info, self.delete_post, self.update_post]
+        return list(self._tools)
@@ -1,3 +1,4 @@
+from functools import cache
 
 from universal_mcp.servers import SingleMCPServer
 from universal_mcp.integrations import AgentRIntegration
@@ -5,16 +6,27 @@ from universal_mcp.stores import EnvironmentStore
 
 from universal_mcp_linkedin.app import LinkedinApp
 
-env_store = EnvironmentStore()
-# "name" used in AgentRIntegration should match the actual name from the backend
-integration_instance = AgentRIntegration(name="linkedin", store=env_store)
-app_instance = LinkedinApp(integration=integration_instance)
 
-mcp = SingleMCPServer(
-    app_instance=app_instance,
-)
+@cache
+def build_server() -> SingleMCPServer:
+    env_store = EnvironmentStore()
+    # "name" used in AgentRIntegration should match the actual name from the backend
+    integration_instance = AgentRIntegration(name="linkedin", store=env_store)
+    app_instance = LinkedinApp(integration=integration_instance)
+
+    return SingleMCPServer(
+        app_instance=app_instance,
+    )
+
+
+def __getattr__(name: str):
+    # Keep `mcp` importable without building the server at import time.
+    if name == "mcp":
+        return build_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    mcp.run()
+    build_server().run()
 
 
@@ -1,11 +1,16 @@
+import asyncio
 from unittest.mock import MagicMock
+from urllib.parse import quote
 
+import httpx
+import orjson
 import pytest
+from universal_mcp.integrations import AgentRIntegration
 from universal_mcp.utils.testing import (
     check_application_instance,
 )
 
-from universal_mcp_linkedin.app import LinkedinApp
+from universal_mcp_linkedin.app import LinkedinApp, _encode_urn
 
 @pytest.fixture
 def app_instance():
@@ -13,5 +18,212 @@ def app_instance():
     mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
     return LinkedinApp(integration=mock_integration)
 
+def use_transport(app_instance, handler):
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="linkedin")
+
+def test_headers_are_cached(app_instance):
+    first = app_instance._get_headers()
+    assert app_instance._get_headers() is first
+    assert app_instance.integration.get_credentials.call_count == 1
+    app_instance._invalidate_headers()
+    assert app_instance._get_headers() == first
+    assert app_instance.integration.get_credentials.call_count == 2
+
+@pytest.mark.parametrize(
+    "urn",
+    [
+        "urn:li:share:6844785523593134080",
+        "urn:li:ugcPost:123",
+        "urn:li:share:a/b c",
+        "not-a-urn",
+    ],
+)
+def test_encode_urn_matches_quote(urn):
+    assert _encode_urn(urn) == quote(urn, safe="")
+
+def test_batch_delete_posts(app_instance):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "results": {"urn:li:share:1": {"status": 204}},
+                "errors": {"urn:li:share:2": {"status": 404, "message": "Not Found"}},
+            },
+        )
+
+    use_transport(app_instance, handler)
+    urns = ["urn:li:share:1", "urn:li:share:2"]
+    result = asyncio.run(app_instance.batch_delete_posts(urns))
+
+    assert result == {
+        "deleted": ["urn:li:share:1"],
+        "failed": {"urn:li:share:2": {"status": 404, "message": "Not Found"}},
+    }
+    assert len(requests) == 1
+    assert requests[0].method == "DELETE"
+    assert requests[0].headers["X-RestLi-Method"] == "BATCH_DELETE"
+    assert requests[0].url.raw_path.decode().endswith(
+        "?ids=List(urn%3Ali%3Ashare%3A1,urn%3Ali%3Ashare%3A2)"
+    )
+
+def test_create_post(app_instance):
+    def handler(request):
+        assert request.method == "POST"
+        assert request.url.path == "/rest/posts"
+        assert orjson.loads(request.content)["commentary"] == "Hello"
+        return httpx.Response(201, headers={"x-restli-id": "urn:li:share:1"})
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(app_instance.create_post("Hello", author="urn:li:person:abc"))
+
+    assert result == {
+        "post_urn": "urn:li:share:1",
+        "post_url": "https://www.linkedin.com/feed/update/urn:li:share:1",
+    }
+
+def test_bind_poster(app_instance):
+    bodies = []
+
+    def handler(request):
+        bodies.append(orjson.loads(request.content))
+        urn = f"urn:li:share:{len(bodies)}"
+        return httpx.Response(201, headers={"x-restli-id": urn})
+
+    use_transport(app_instance, handler)
+    post = app_instance.bind_poster(
+        author="urn:li:person:abc", visibility="CONNECTIONS"
+    )
+    result = asyncio.run(post("Hello"))
+
+    assert result["post_urn"] == "urn:li:share:1"
+    assert bodies[0]["commentary"] == "Hello"
+    assert bodies[0]["author"] == "urn:li:person:abc"
+    assert bodies[0]["visibility"] == "CONNECTIONS"
+
+def test_get_your_info_is_cached(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"sub": "abc"})
+
+    use_transport(app_instance, handler)
+
+    async def run():
+        first = await app_instance.get_your_info()
+        second = await app_instance.get_your_info()
+        app_instance._invalidate_headers()
+        third = await app_instance.get_your_info()
+        return first, second, third
+
+    assert asyncio.run(run()) == ({"sub": "abc"},) * 3
+    assert [request.method for request in calls] == ["GET", "GET"]
+
+@pytest.mark.parametrize(
+    "urn", ["urn:li:share:", "urn:li:person:123", "share:123", "urn:li:share:123 "]
+)
+def test_invalid_post_urn_is_rejected(app_instance, urn):
+    def handler(request):
+        raise AssertionError("no request should be sent")
+
+    use_transport(app_instance, handler)
+    with pytest.raises(ValueError, match="Invalid post URN"):
+        asyncio.run(app_instance.delete_post(urn))
+
+def test_create_posts_reports_partial_failures(app_instance):
+    app_instance._RATE_LIMIT_BACKOFF = 0
+    attempts = {}
+
+    def handler(request):
+        commentary = orjson.loads(request.content)["commentary"]
+        attempts[commentary] = attempts.get(commentary, 0) + 1
+        if commentary == "throttled" and attempts[commentary] == 1:
+            return httpx.Response(429, request=request)
+        if commentary == "forbidden":
+            return httpx.Response(403, request=request)
+        urn = f"urn:li:share:{commentary}"
+        return httpx.Response(201, headers={"x-restli-id": urn})
+
+    use_transport(app_instance, handler)
+    items = [
+        {"commentary": "ok", "author": "urn:li:person:abc"},
+        {"commentary": "forbidden", "author": "urn:li:person:abc"},
+        {"commentary": "throttled", "author": "urn:li:person:abc"},
+    ]
+    result = asyncio.run(app_instance.create_posts(items))
+
+    created = {index: post["post_urn"] for index, post in result["created"].items()}
+    assert created == {"0": "urn:li:share:ok", "2": "urn:li:share:throttled"}
+    assert list(result["failed"]) == ["1"]
+    assert attempts == {"ok": 1, "forbidden": 1, "throttled": 2}
+
+def test_request_retried_once_after_401(app_instance):
+    app_instance.integration.get_credentials.side_effect = [
+        {"access_token": "expired"},
+        {"access_token": "fresh"},
+    ]
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer expired":
+            return httpx.Response(401, request=request)
+        return httpx.Response(204, request=request)
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(app_instance.delete_post("urn:li:share:1"))
+
+    assert result == {"status": "deleted", "post_urn": "urn:li:share:1"}
+    assert tokens == ["Bearer expired", "Bearer fresh"]
+
+def test_batch_delete_posts_missing_urn_is_failed(app_instance):
+    def handler(request):
+        return httpx.Response(200, json={"results": {}})
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(app_instance.batch_delete_posts(["urn:li:share:1"]))
+
+    assert result["deleted"] == []
+    assert list(result["failed"]) == ["urn:li:share:1"]
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_create_posts_rejects_invalid_concurrency(app_instance, concurrency):
+    items = [{"commentary": "Hello", "author": "urn:li:person:abc"}]
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(app_instance.create_posts(items, concurrency=concurrency))
+
+class CachingIntegration(AgentRIntegration):
+    """Caches credentials after the first fetch, like AgentRIntegration."""
+
+    def __init__(self, tokens):
+        self._credentials = None
+        self._tokens = iter(tokens)
+
+    def get_credentials(self):
+        if self._credentials is None:
+            self._credentials = {"access_token": next(self._tokens)}
+        return self._credentials
+
+def test_request_retry_refreshes_cached_credentials():
+    app_instance = LinkedinApp(integration=CachingIntegration(["expired", "fresh"]))
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer expired":
+            return httpx.Response(401, request=request)
+        return httpx.Response(204, request=request)
+
+    use_transport(app_instance, handler)
+    result = asyncio.run(app_instance.delete_post("urn:li:share:1"))
+
+    assert result == {"status": "deleted", "post_urn": "urn:li:share:1"}
+    assert tokens == ["Bearer expired", "Bearer fresh"]